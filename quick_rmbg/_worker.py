@@ -0,0 +1,45 @@
+"""
+Standalone warm rembg worker.
+
+Imports rembg and loads the model once, then serves "input<TAB>output"
+path pairs over stdin, replying "ok" or "error<TAB>message" per line on
+stdout. Deliberately imports nothing from quick_rmbg so it can run under
+the rembg binary's own interpreter, which may be a different Python than
+the one running the CLI.
+"""
+
+import sys
+
+
+def main() -> int:
+    try:
+        from PIL import Image
+        from rembg import new_session, remove
+    except ImportError as e:
+        print(f"error\t{e}", flush=True)
+        return 1
+
+    model = sys.argv[1] if len(sys.argv) > 1 else "u2net"
+    session = new_session(model)
+    print("ready", flush=True)
+
+    for line in sys.stdin:
+        line = line.rstrip("\n")
+        if not line:
+            continue
+        try:
+            input_path, output_path = line.split("\t", 1)
+            # Hand PIL the file directly and save the result image straight
+            # to disk, so encoded input/output bytes are never buffered here
+            # on top of the decoded pixels
+            result = remove(Image.open(input_path), session=session)
+            result.save(output_path, format="PNG")
+            print("ok", flush=True)
+        except Exception as e:
+            print(f"error\t{e}", flush=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,71 +1,180 @@
 """CLI wrapper for Quick-RMBG background removal."""
 
+import argparse
+import asyncio
+import functools
+import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-from .config import get_rembg_binary, get_output_suffix, get_model, get_rocm_gfx_version
+from . import daemon, engine
+from .config import get_output_suffix, get_runtime_config, override_model
 
 # Supported image formats
-SUPPORTED_FORMATS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff", ".tif"}
+SUPPORTED_FORMATS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff", ".tif"})
+
+# Subprocess timeout when the image dimensions can't be read
+DEFAULT_TIMEOUT = 120.0
+
+# Fixed timeout from --timeout; overrides the size-scaled one
+_timeout_override = None
+
+
+def _image_timeout(input_path: Path) -> float:
+    """
+    Pick a subprocess timeout scaled by image area.
+
+    PIL only reads the header here, not the pixel data. Keeps one stuck
+    image in a batch from stalling for the full worst-case timeout.
+
+    Args:
+        input_path: Path to input image
+
+    Returns:
+        Timeout in seconds
+    """
+    if _timeout_override is not None:
+        return _timeout_override
+
+    try:
+        from PIL import Image
+
+        with Image.open(input_path) as img:
+            width, height = img.size
+        return max(10.0, width * height / 1e6 * 5.0)
+    except Exception:
+        return DEFAULT_TIMEOUT
+
+
+def _validate(input_path: Path) -> str | None:
+    """
+    Validate that an input file exists and has a supported extension.
+
+    Args:
+        input_path: Path to check
+
+    Returns:
+        An error message, or None if the file is valid
+    """
+    if not input_path.exists():
+        return f"File not found: {input_path}"
+
+    # splitext on the raw string skips the PurePath.suffix property overhead
+    suffix = os.path.splitext(str(input_path))[1].lower()
+    if suffix not in SUPPORTED_FORMATS:
+        return f"Unsupported format: {suffix}"
+
+    return None
 
 
 def _run_rembg(input_path: Path, output_path: Path, rembg_binary: Path, model: str, env: dict) -> tuple[bool, str]:
     """
     Run rembg on a single image.
 
+    Uses the in-process rembg API when available, so the model is loaded
+    once per process instead of once per image. Falls back to spawning the
+    rembg binary if the Python API can't be imported.
+
     Args:
         input_path: Path to input image
         output_path: Path for output
-        rembg_binary: Path to rembg binary
+        rembg_binary: Path to rembg binary (fallback only)
         model: Model name to use
-        env: Environment variables
+        env: Environment variables (fallback only)
 
     Returns:
         Tuple of (success, error_message or empty string)
     """
+    # A running daemon already has the model loaded; prefer it
+    result = daemon.submit(input_path, output_path, model)
+    if result is not None:
+        return result
+
+    if engine.HAS_REMBG_API:
+        try:
+            output_path.write_bytes(engine.run_rembg_bytes(input_path.read_bytes(), model))
+            return True, ""
+        except Exception as e:
+            return False, str(e)
+
+    # Warm fallback: a prespawned worker that keeps the model loaded between images
+    worker = engine.get_worker(rembg_binary, model, env)
+    if worker is not None:
+        success, error = worker.submit(input_path, output_path, _image_timeout(input_path))
+        if success or error != "rembg worker failed to start":
+            return success, error
+
+    # Last resort: one-shot rembg subprocess per image
+    timeout = _image_timeout(input_path)
     try:
         result = subprocess.run(
             [str(rembg_binary), "i", str(input_path), str(output_path), "-m", model],
             capture_output=True,
-            text=True,
             env=env,
-            timeout=120,  # 2 minute timeout
+            timeout=timeout,
         )
 
         if result.returncode == 0:
             return True, ""
         else:
-            error = result.stderr or result.stdout or "Unknown error"
+            # Only decode the captured output on failure; on success it's discarded
+            error = (result.stderr or result.stdout or b"Unknown error").decode("utf-8", "replace")
             return False, error
 
     except subprocess.TimeoutExpired:
-        return False, "Operation timed out (>2 minutes)"
+        return False, f"Operation timed out (>{timeout:.0f}s)"
     except Exception as e:
         return False, str(e)
 
 
+def _run_rembg_bytes(data: bytes, model: str) -> tuple[bytes | None, str]:
+    """
+    Run rembg on in-memory image bytes using the shared session.
+
+    Used by the multi-pass modes to chain passes without re-encoding and
+    re-reading intermediates from disk.
+
+    Args:
+        data: Encoded input image bytes
+        model: Model name to use
+
+    Returns:
+        Tuple of (output bytes or None on failure, error_message or empty string)
+    """
+    try:
+        return engine.run_rembg_bytes(data, model), ""
+    except Exception as e:
+        return None, str(e)
+
+
+@functools.lru_cache(maxsize=1)
 def _prepare_rembg() -> tuple[Path | None, str, dict, str]:
     """
     Prepare rembg for execution.
 
+    The result (binary, model, and environment) is identical for every
+    image in a run, so it's computed once and reused — batch and
+    multi-pass modes no longer rebuild the env dict per pass.
+
     Returns:
         Tuple of (rembg_binary, model, env, error_message)
     """
-    import os
-
-    rembg_binary = get_rembg_binary()
-    if rembg_binary is None:
+    runtime = get_runtime_config()
+    if runtime.binary is None and not engine.HAS_REMBG_API:
         return None, "", {}, "rembg not found.\nInstall it with: pip install rembg[cli]"
 
-    model = get_model()
-
     env = os.environ.copy()
-    rocm_gfx = get_rocm_gfx_version()
-    if rocm_gfx:
-        env["HSA_OVERRIDE_GFX_VERSION"] = rocm_gfx
+    if runtime.rocm_gfx_version:
+        env["HSA_OVERRIDE_GFX_VERSION"] = runtime.rocm_gfx_version
+
+    # Start the warm worker early so the model loads while input is validated
+    if not engine.HAS_REMBG_API and runtime.binary is not None:
+        engine.prespawn_worker(runtime.binary, runtime.model, env)
 
-    return rembg_binary, model, env, ""
+    return runtime.binary, runtime.model, env, ""
 
 
 def remove_background(input_path: Path, output_path: Path | None = None) -> tuple[bool, str]:
@@ -80,15 +189,13 @@ def remove_background(input_path: Path, output_path: Path | None = None) -> tupl
         Tuple of (success, message)
     """
     # Validate input
-    if not input_path.exists():
-        return False, f"File not found: {input_path}"
-
-    if input_path.suffix.lower() not in SUPPORTED_FORMATS:
-        return False, f"Unsupported format: {input_path.suffix}"
+    error = _validate(input_path)
+    if error:
+        return False, error
 
     # Prepare rembg
     rembg_binary, model, env, error = _prepare_rembg()
-    if rembg_binary is None:
+    if error:
         return False, error
 
     # Determine output path
@@ -119,39 +226,224 @@ def remove_background_two_pass(input_path: Path) -> tuple[bool, str]:
         Tuple of (success, message)
     """
     # Validate input
-    if not input_path.exists():
-        return False, f"File not found: {input_path}"
-
-    if input_path.suffix.lower() not in SUPPORTED_FORMATS:
-        return False, f"Unsupported format: {input_path.suffix}"
+    error = _validate(input_path)
+    if error:
+        return False, error
 
     # Prepare rembg
     rembg_binary, model, env, error = _prepare_rembg()
-    if rembg_binary is None:
+    if error:
         return False, error
 
     # First pass output path
     first_pass_path = input_path.parent / f"{input_path.stem}_noBG-first-pass.png"
 
-    # Run first pass
-    success, error = _run_rembg(input_path, first_pass_path, rembg_binary, model, env)
-    if not success:
-        return False, f"First pass failed: {error}"
-
     # Second pass output path
     second_pass_path = input_path.parent / f"{input_path.stem}_noBG-second-pass.png"
 
-    # Run second pass on the first pass result
-    success, error = _run_rembg(first_pass_path, second_pass_path, rembg_binary, model, env)
-    if not success:
-        return False, f"Second pass failed: {error}"
+    if engine.HAS_REMBG_API:
+        # Chain passes in memory; intermediates are written for preview but
+        # never re-read, skipping a PNG encode+decode round-trip per pass
+        data, error = _run_rembg_bytes(input_path.read_bytes(), model)
+        if data is None:
+            return False, f"First pass failed: {error}"
+        first_pass_path.write_bytes(data)
+
+        data, error = _run_rembg_bytes(data, model)
+        if data is None:
+            return False, f"Second pass failed: {error}"
+        second_pass_path.write_bytes(data)
+    else:
+        # Subprocess fallback: passes go through disk
+        success, error = _run_rembg(input_path, first_pass_path, rembg_binary, model, env)
+        if not success:
+            return False, f"First pass failed: {error}"
+
+        success, error = _run_rembg(first_pass_path, second_pass_path, rembg_binary, model, env)
+        if not success:
+            return False, f"Second pass failed: {error}"
 
     return True, f"Two-pass background removal complete.\nFirst pass: {first_pass_path.name}\nFinal: {second_pass_path.name}"
 
 
+async def _batch_pipeline(files: list[Path], directory: Path, suffix: str, model: str, jobs: int) -> tuple[int, list[str]]:
+    """
+    Run the batch stages (read, infer, write) as an asyncio pipeline.
+
+    Bounded queues sit between the stages, so while image K is being
+    inferred, image K+1 is being read and image K-1 is being written.
+    Inference runs on a single worker so the model session is never used
+    concurrently.
+
+    Args:
+        files: Input images to process
+        directory: Directory to write outputs into
+        suffix: Output filename suffix
+        model: Model name to use
+        jobs: Number of I/O worker threads
+
+    Returns:
+        Tuple of (number processed, list of per-file failure messages)
+    """
+    loop = asyncio.get_running_loop()
+    decoded = asyncio.Queue(maxsize=2)
+    results = asyncio.Queue(maxsize=2)
+    processed = 0
+    failures = []
+
+    io_pool = ThreadPoolExecutor(max_workers=max(1, jobs))
+    infer_pool = ThreadPoolExecutor(max_workers=1)
+
+    async def read_stage():
+        for input_path in files:
+            # An unreadable file is a per-file failure, not a batch abort
+            try:
+                data = await loop.run_in_executor(io_pool, input_path.read_bytes)
+            except OSError as e:
+                failures.append(f"{input_path.name}: {e}")
+                continue
+            await decoded.put((input_path, data))
+        await decoded.put(None)
+
+    async def infer_stage():
+        while (item := await decoded.get()) is not None:
+            input_path, data = item
+            data, error = await loop.run_in_executor(infer_pool, _run_rembg_bytes, data, model)
+            if data is None:
+                failures.append(f"{input_path.name}: {error}")
+            else:
+                await results.put((input_path, data))
+        await results.put(None)
+
+    async def write_stage():
+        nonlocal processed
+        while (item := await results.get()) is not None:
+            input_path, data = item
+            output_path = directory / f"{input_path.stem}{suffix}.png"
+            try:
+                await loop.run_in_executor(io_pool, output_path.write_bytes, data)
+            except OSError as e:
+                failures.append(f"{input_path.name}: {e}")
+                continue
+            processed += 1
+
+    try:
+        await asyncio.gather(read_stage(), infer_stage(), write_stage())
+    finally:
+        io_pool.shutdown(wait=True)
+        infer_pool.shutdown(wait=True)
+
+    return processed, failures
+
+
+def _batch_init_worker(model: str) -> None:
+    """Load the model session once per worker process, not per image."""
+    engine.get_session(model)
+
+
+def _batch_process_one(task: tuple[Path, Path, str]) -> str | None:
+    """
+    Process one image inside a batch worker process.
+
+    Args:
+        task: Tuple of (input_path, output_path, model)
+
+    Returns:
+        An error message, or None on success
+    """
+    input_path, output_path, model = task
+    # Any exception here would propagate through pool.map and abort the
+    # whole batch; report it as this file's failure instead
+    try:
+        data, error = _run_rembg_bytes(input_path.read_bytes(), model)
+        if data is None:
+            return f"{input_path.name}: {error}"
+        output_path.write_bytes(data)
+    except Exception as e:
+        return f"{input_path.name}: {e}"
+    return None
+
+
+def remove_background_batch(directory: Path, jobs: int = 2, processes: int = 0) -> tuple[bool, str]:
+    """
+    Remove backgrounds from every supported image in a directory.
+
+    The model session is loaded once and shared across all images, so the
+    per-invocation startup cost is paid a single time for the whole folder.
+    File reads and writes run on a small thread pool so I/O overlaps with
+    inference. With processes > 0 (CPU-bound setups), images are instead
+    spread across one process pool whose workers each load the model once.
+
+    Args:
+        directory: Directory containing input images
+        jobs: Number of I/O worker threads
+        processes: Number of inference worker processes (0 = in-process)
+
+    Returns:
+        Tuple of (success, message)
+    """
+    if not directory.is_dir():
+        return False, f"Not a directory: {directory}"
+
+    # Prepare rembg
+    rembg_binary, model, env, error = _prepare_rembg()
+    if error:
+        return False, error
+
+    suffix = get_output_suffix()
+    files = sorted(
+        p for p in directory.iterdir()
+        if p.suffix.lower() in SUPPORTED_FORMATS and not p.stem.endswith(suffix)
+    )
+    if not files:
+        return False, f"No supported images found in: {directory}"
+
+    processed = 0
+    failures = []
+
+    if engine.HAS_REMBG_API and processes > 0:
+        # One pool for the whole run; each worker loads its own session in
+        # the initializer and keeps it for every image it's handed
+        tasks = [(p, directory / f"{p.stem}{suffix}.png", model) for p in files]
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_batch_init_worker,
+            initargs=(model,),
+        ) as pool:
+            for error in pool.map(_batch_process_one, tasks, chunksize=4):
+                if error is None:
+                    processed += 1
+                else:
+                    failures.append(error)
+    elif engine.HAS_REMBG_API:
+        processed, failures = asyncio.run(_batch_pipeline(files, directory, suffix, model, jobs))
+    else:
+        # Subprocess fallback: one rembg spawn per image
+        for input_path in files:
+            output_path = directory / f"{input_path.stem}{suffix}.png"
+            success, error = _run_rembg(input_path, output_path, rembg_binary, model, env)
+            if success:
+                processed += 1
+            else:
+                failures.append(f"{input_path.name}: {error}")
+
+    if failures:
+        failed_list = "\n".join(f"  {f}" for f in failures)
+        return False, f"Batch complete: {processed}/{len(files)} images processed.\nFailed:\n{failed_list}"
+
+    return True, f"Batch complete: {processed} images processed in {directory.name}/"
+
+
+@functools.lru_cache(maxsize=1)
+def _dialog_tool() -> str | None:
+    """Detect the available question-dialog tool once per process."""
+    # Prefer kdialog (KDE native), then zenity
+    return shutil.which("kdialog") or shutil.which("zenity")
+
+
 def _ask_user_happy(image_path: Path, pass_number: int) -> bool:
     """
-    Ask the user if they're happy with the result using kdialog.
+    Ask the user if they're happy with the result using kdialog or zenity.
 
     Args:
         image_path: Path to the result image to show
@@ -162,48 +454,41 @@ def _ask_user_happy(image_path: Path, pass_number: int) -> bool:
     """
     message = f"Pass {pass_number} complete!\n\nResult saved to:\n{image_path.name}\n\nAre you happy with the result?"
 
-    try:
-        # Use kdialog yesno dialog
-        result = subprocess.run(
-            [
-                "kdialog",
-                "--yesno",
-                message,
-                "--title",
-                "Quick RMBG - Infinite Hop Mode",
-                "--yes-label",
-                "Yes, I'm done!",
-                "--no-label",
-                "No, run another pass",
-            ],
-            capture_output=True,
-        )
-        # kdialog returns 0 for Yes, 1 for No
-        return result.returncode == 0
+    tool = _dialog_tool()
+    if tool is None:
+        # No GUI available, assume user is happy after first pass
+        print("No dialog tool available (kdialog/zenity). Stopping after this pass.")
+        return True
 
-    except FileNotFoundError:
-        # Fall back to zenity if kdialog not available
-        try:
-            result = subprocess.run(
-                [
-                    "zenity",
-                    "--question",
-                    "--text",
-                    message,
-                    "--title",
-                    "Quick RMBG - Infinite Hop Mode",
-                    "--ok-label",
-                    "Yes, I'm done!",
-                    "--cancel-label",
-                    "No, run another pass",
-                ],
-                capture_output=True,
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            # No GUI available, assume user is happy after first pass
-            print("No dialog tool available (kdialog/zenity). Stopping after this pass.")
-            return True
+    if os.path.basename(tool) == "kdialog":
+        argv = [
+            tool,
+            "--yesno",
+            message,
+            "--title",
+            "Quick RMBG - Infinite Hop Mode",
+            "--yes-label",
+            "Yes, I'm done!",
+            "--no-label",
+            "No, run another pass",
+        ]
+    else:
+        argv = [
+            tool,
+            "--question",
+            "--text",
+            message,
+            "--title",
+            "Quick RMBG - Infinite Hop Mode",
+            "--ok-label",
+            "Yes, I'm done!",
+            "--cancel-label",
+            "No, run another pass",
+        ]
+
+    result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # Both tools return 0 for Yes, 1 for No
+    return result.returncode == 0
 
 
 def remove_background_infinite_hop(input_path: Path) -> tuple[bool, str]:
@@ -220,41 +505,68 @@ def remove_background_infinite_hop(input_path: Path) -> tuple[bool, str]:
         Tuple of (success, message)
     """
     # Validate input
-    if not input_path.exists():
-        return False, f"File not found: {input_path}"
-
-    if input_path.suffix.lower() not in SUPPORTED_FORMATS:
-        return False, f"Unsupported format: {input_path.suffix}"
+    error = _validate(input_path)
+    if error:
+        return False, error
 
     # Prepare rembg
     rembg_binary, model, env, error = _prepare_rembg()
-    if rembg_binary is None:
+    if error:
         return False, error
 
     pass_number = 1
     current_input = input_path
+    current_data = None  # In-memory result of the previous pass (API path only)
     final_output = None
     all_passes = []
+    speculative = None  # Next pass started while the dialog is open (API path only)
+    # Speculation only pays off while a dialog is blocking; without one
+    # _ask_user_happy answers immediately and the extra inference is pure waste
+    spec_pool = ThreadPoolExecutor(max_workers=1) if engine.HAS_REMBG_API and _dialog_tool() else None
 
-    while True:
-        # Output path for this pass
-        output_path = input_path.parent / f"{input_path.stem}_noBG-pass-{pass_number}.png"
-
-        # Run rembg
-        success, error = _run_rembg(current_input, output_path, rembg_binary, model, env)
-        if not success:
-            return False, f"Pass {pass_number} failed: {error}"
-
-        all_passes.append(output_path.name)
-        final_output = output_path
-
-        # Ask user if they're happy
-        if _ask_user_happy(output_path, pass_number):
-            break
-
-        # User wants another pass - use this output as next input
-        current_input = output_path
-        pass_number += 1
+    try:
+        while True:
+            # Output path for this pass
+            output_path = input_path.parent / f"{input_path.stem}_noBG-pass-{pass_number}.png"
+
+            # Run rembg
+            if engine.HAS_REMBG_API:
+                # Feed the in-memory buffer from the previous pass, not the
+                # re-read file; each pass is still written to disk for preview
+                if speculative is not None:
+                    current_data, error = speculative.result()
+                    speculative = None
+                else:
+                    if current_data is None:
+                        current_data = current_input.read_bytes()
+                    current_data, error = _run_rembg_bytes(current_data, model)
+                if current_data is None:
+                    return False, f"Pass {pass_number} failed: {error}"
+                output_path.write_bytes(current_data)
+            else:
+                success, error = _run_rembg(current_input, output_path, rembg_binary, model, env)
+                if not success:
+                    return False, f"Pass {pass_number} failed: {error}"
+
+            all_passes.append(output_path.name)
+            final_output = output_path
+
+            # Start the next pass speculatively while the user reads the
+            # dialog; if they answer "another pass" it's already underway,
+            # and if they're done it costs at most one discarded inference
+            if spec_pool is not None:
+                speculative = spec_pool.submit(_run_rembg_bytes, current_data, model)
+
+            # Ask user if they're happy
+            if _ask_user_happy(output_path, pass_number):
+                break
+
+            # User wants another pass - use this output as next input
+            current_input = output_path
+            pass_number += 1
+    finally:
+        if spec_pool is not None:
+            spec_pool.shutdown(wait=False, cancel_futures=True)
 
     # Build summary message
     if pass_number == 1:
@@ -264,37 +576,41 @@ def remove_background_infinite_hop(input_path: Path) -> tuple[bool, str]:
         return True, f"Infinite Hop complete after {pass_number} passes.\n{passes_list}\nFinal: {final_output.name}"
 
 
+@functools.lru_cache(maxsize=1)
+def _notifier() -> str | None:
+    """Detect the available notification tool once per process."""
+    # Prefer kdialog (KDE native), then notify-send
+    return shutil.which("kdialog") or shutil.which("notify-send")
+
+
 def show_notification(title: str, message: str, success: bool = True) -> None:
     """Show a desktop notification using kdialog or notify-send."""
     icon = "dialog-ok" if success else "dialog-error"
 
-    # Try kdialog first (KDE native)
-    try:
-        subprocess.run(
-            ["kdialog", "--passivepopup", message, "5", "--title", title, "--icon", icon],
-            check=True,
-            capture_output=True,
-        )
+    tool = _notifier()
+    if tool is None:
+        # No notification tool: print to stderr
+        print(f"{title}: {message}", file=sys.stderr)
         return
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
 
-    # Fall back to notify-send
+    if os.path.basename(tool) == "kdialog":
+        argv = [tool, "--passivepopup", message, "5", "--title", title, "--icon", icon]
+    else:
+        argv = [tool, "-i", icon, title, message]
+
     try:
         subprocess.run(
-            ["notify-send", "-i", icon, title, message],
+            argv,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
-        # Last resort: print to stderr
         print(f"{title}: {message}", file=sys.stderr)
 
 
 def main():
     """CLI entry point."""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description="Quick background removal for images",
         prog="quick-rmbg",
@@ -302,8 +618,31 @@ def main():
     parser.add_argument(
         "input",
         type=Path,
+        nargs="?",
+        default=None,
         help="Input image file",
     )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Process every supported image in DIR with a single model session",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Number of I/O worker threads in batch mode (default: 2)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Parallelize batch inference across N worker processes (CPU-only setups; each loads its own model copy)",
+    )
     parser.add_argument(
         "-o", "--output",
         type=Path,
@@ -330,15 +669,64 @@ def main():
         action="store_true",
         help="Run background removal repeatedly until you're happy with the result",
     )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Quantize the cached model to INT8 for faster CPU inference, then exit",
+    )
+    parser.add_argument(
+        "--hq",
+        action="store_true",
+        help="Use the full u2net model instead of the faster default (u2netp)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a daemon holding the model loaded for other invocations",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Fixed per-image timeout (default: scaled by image size)",
+    )
 
     args = parser.parse_args()
 
+    global _timeout_override
+    if args.timeout:
+        _timeout_override = args.timeout
+
+    if args.hq:
+        override_model("u2net")
+
+    if args.daemon:
+        sys.exit(daemon.serve())
+
+    if args.quantize:
+        from .quantize import quantize_model
+
+        success, message = quantize_model()
+        print(message)
+        sys.exit(0 if success else 1)
+
     # Check for conflicting options
     if args.two_pass and args.infinite_hop:
         print("Error: Cannot use --two-pass and --infinite-hop together", file=sys.stderr)
         sys.exit(1)
 
-    if args.infinite_hop:
+    if args.batch and (args.two_pass or args.infinite_hop):
+        print("Error: --batch cannot be combined with --two-pass or --infinite-hop", file=sys.stderr)
+        sys.exit(1)
+
+    if args.batch is None and args.input is None:
+        parser.error("an input image (or --batch DIR, or --daemon) is required")
+
+    if args.batch:
+        success, message = remove_background_batch(args.batch, args.jobs, args.processes)
+        title = "Quick RMBG (Batch)"
+    elif args.infinite_hop:
         success, message = remove_background_infinite_hop(args.input)
         title = "Quick RMBG (Infinite Hop)"
     elif args.two_pass:
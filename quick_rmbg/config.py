@@ -1,7 +1,9 @@
 """Configuration management for Quick-RMBG."""
 
+import functools
 import json
 import shutil
+from collections import namedtuple
 from pathlib import Path
 
 CONFIG_FILE = Path.home() / ".config" / "quick-rmbg" / "config.json"
@@ -9,8 +11,10 @@ CONFIG_FILE = Path.home() / ".config" / "quick-rmbg" / "config.json"
 DEFAULT_CONFIG = {
     "rembg_binary": "",  # Auto-detected if empty
     "output_suffix": "_noBG",
-    "model": "u2net",  # Options: u2net, u2netp, u2net_human_seg, silueta, isnet-general-use
+    "model": "u2netp",  # Options: u2net, u2netp, u2net_human_seg, silueta, isnet-general-use
     "rocm_gfx_version": "11.0.1",  # For AMD ROCm; set to null/empty for NVIDIA/CPU
+    "quantize": False,  # Use the INT8-quantized model if one has been generated
+    "use_daemon": False,  # Autostart the model-holding daemon on first use
 }
 
 
@@ -29,6 +33,12 @@ def load_config() -> dict:
     return DEFAULT_CONFIG.copy()
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_config() -> dict:
+    """Load the merged config once and reuse it for the process lifetime."""
+    return load_config()
+
+
 def save_config(config: dict) -> None:
     """Save configuration to file."""
     ensure_config_dir()
@@ -36,8 +46,9 @@ def save_config(config: dict) -> None:
         json.dump(config, f, indent=2)
 
 
+@functools.lru_cache(maxsize=1)
 def find_rembg_binary() -> Path | None:
-    """Find rembg binary in PATH or common locations."""
+    """Find rembg binary in PATH or common locations (cached per process)."""
     # Check PATH first
     rembg = shutil.which("rembg")
     if rembg:
@@ -58,7 +69,7 @@ def find_rembg_binary() -> Path | None:
 
 def get_rembg_binary() -> Path | None:
     """Get the path to the rembg binary."""
-    config = load_config()
+    config = _cached_config()
 
     # If explicitly configured, use that
     if config.get("rembg_binary"):
@@ -72,14 +83,27 @@ def get_rembg_binary() -> Path | None:
 
 def get_output_suffix() -> str:
     """Get the suffix to append to output files."""
-    config = load_config()
+    config = _cached_config()
     return config["output_suffix"]
 
 
+# Per-process model override (e.g. the --hq flag); takes priority over config
+_model_override = None
+
+
+def override_model(model: str) -> None:
+    """Force a model for the rest of this process, ignoring the config."""
+    global _model_override
+    _model_override = model
+    get_runtime_config.cache_clear()
+
+
 def get_model() -> str:
     """Get the model to use for background removal."""
-    config = load_config()
-    return config.get("model", "u2net")
+    if _model_override:
+        return _model_override
+    config = _cached_config()
+    return config.get("model", "u2netp")
 
 
 def set_rembg_binary(path: str) -> None:
@@ -87,13 +111,48 @@ def set_rembg_binary(path: str) -> None:
     config = load_config()
     config["rembg_binary"] = path
     save_config(config)
+    _cached_config.cache_clear()
+    get_runtime_config.cache_clear()
+
+
+def get_use_daemon() -> bool:
+    """Whether the CLI may autostart the model-holding daemon."""
+    config = _cached_config()
+    return bool(config.get("use_daemon", False))
+
+
+def get_quantize() -> bool:
+    """Whether to prefer the INT8-quantized model when available."""
+    config = _cached_config()
+    return bool(config.get("quantize", False))
+
+
+def set_quantize(enabled: bool) -> None:
+    """Enable or disable use of the INT8-quantized model."""
+    config = load_config()
+    config["quantize"] = enabled
+    save_config(config)
+    _cached_config.cache_clear()
 
 
 def get_rocm_gfx_version() -> str | None:
     """Get the ROCm GFX version for AMD GPUs. Returns None if disabled."""
-    config = load_config()
+    config = _cached_config()
     version = config.get("rocm_gfx_version", "11.0.1")
     # Treat empty string or null as disabled
     if not version:
         return None
     return version
+
+
+RuntimeConfig = namedtuple("RuntimeConfig", ["binary", "model", "rocm_gfx_version"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_runtime_config() -> RuntimeConfig:
+    """Get the binary, model, and ROCm setting in a single cached read."""
+    return RuntimeConfig(
+        binary=get_rembg_binary(),
+        model=get_model(),
+        rocm_gfx_version=get_rocm_gfx_version(),
+    )
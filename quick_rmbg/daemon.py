@@ -0,0 +1,188 @@
+"""
+Daemon that keeps the model session loaded across CLI invocations.
+
+`quick-rmbg --daemon` holds the rembg session behind an abstract UNIX
+socket (one per user, no filesystem entry). Subsequent CLI runs connect
+and hand over input/output paths, skipping the per-process weight load
+entirely. With `use_daemon` enabled in the config, the CLI autostarts
+the daemon on first use.
+"""
+
+import asyncio
+import os
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+
+from . import engine
+from .config import get_model, get_use_daemon
+
+# Abstract UNIX socket address, one daemon per user
+SOCKET_ADDRESS = f"\0quick-rmbg-{os.getuid()}"
+
+# The session isn't safe for concurrent use; serialize inference
+_infer_lock = asyncio.Lock()
+
+# Latched when autostarting a daemon didn't produce a reachable socket,
+# so the spawn-and-retry wait is paid at most once per process
+_autostart_failed = False
+
+
+def _peer_uid(writer) -> int | None:
+    """Get the UID of the connected peer via SO_PEERCRED."""
+    sock = writer.get_extra_info("socket")
+    try:
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("iii"))
+        _pid, uid, _gid = struct.unpack("iii", creds)
+        return uid
+    except (OSError, AttributeError):
+        return None
+
+
+async def _handle_client(reader, writer) -> None:
+    """Serve newline-delimited "input<TAB>output<TAB>model" requests."""
+    # Abstract sockets carry no filesystem permissions, so enforce identity
+    # here: the daemon reads and writes arbitrary paths on the client's
+    # behalf and must only do that for its own user
+    if _peer_uid(writer) != os.getuid():
+        writer.close()
+        return
+
+    loop = asyncio.get_running_loop()
+    try:
+        while line := await reader.readline():
+            try:
+                input_path, output_path, model = line.decode().rstrip("\n").split("\t")
+                data = await loop.run_in_executor(None, Path(input_path).read_bytes)
+                async with _infer_lock:
+                    data = await loop.run_in_executor(None, engine.run_rembg_bytes, data, model)
+                await loop.run_in_executor(None, Path(output_path).write_bytes, data)
+                writer.write(b"ok\n")
+            except Exception as e:
+                writer.write(f"error\t{e}\n".encode())
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _serve() -> None:
+    # Bind before loading the model so clients can connect right away
+    server = await asyncio.start_unix_server(_handle_client, path=SOCKET_ADDRESS)
+
+    # Warm the session up front instead of on the first request
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(None, engine.get_session, get_model())
+
+    async with server:
+        await server.serve_forever()
+
+
+def serve() -> int:
+    """Run the daemon in the foreground. Returns an exit code."""
+    if not engine.HAS_REMBG_API:
+        print("Daemon mode needs the rembg Python API.\nInstall it with: pip install rembg", file=sys.stderr)
+        return 1
+
+    try:
+        asyncio.run(_serve())
+    except OSError as e:
+        # Most likely EADDRINUSE: another daemon is already running
+        print(f"Could not bind daemon socket: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _connect() -> socket.socket | None:
+    """Connect to a running daemon, or return None."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(600)
+    try:
+        sock.connect(SOCKET_ADDRESS)
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def _spawn_daemon() -> None:
+    """Double-fork a detached daemon process."""
+    pid = os.fork()
+    if pid:
+        os.waitpid(pid, 0)
+        return
+
+    # First child: detach from the terminal, then fork the real daemon
+    os.setsid()
+    if os.fork():
+        os._exit(0)
+
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.execv(sys.executable, [sys.executable, "-m", "quick_rmbg.daemon"])
+
+
+def submit(input_path: Path, output_path: Path, model: str) -> tuple[bool, str] | None:
+    """
+    Process one image through the daemon.
+
+    A running daemon is always used (the connect attempt is one syscall);
+    autostarting one on demand requires `use_daemon` in the config.
+
+    Args:
+        input_path: Path to input image
+        output_path: Path for output
+        model: Model name to use
+
+    Returns:
+        Tuple of (success, error_message or empty string), or None when no
+        daemon can be reached so the caller falls back to local processing.
+    """
+    global _autostart_failed
+
+    sock = _connect()
+    if sock is None:
+        if not get_use_daemon() or _autostart_failed:
+            return None
+        # A forked daemon runs under this same interpreter, so without the
+        # rembg API it would just refuse and waste the whole retry wait
+        if not engine.HAS_REMBG_API:
+            return None
+        _spawn_daemon()
+        # The daemon binds its socket before loading the model, so this
+        # normally succeeds within a few retries
+        for _ in range(50):
+            time.sleep(0.1)
+            sock = _connect()
+            if sock is not None:
+                break
+        else:
+            _autostart_failed = True
+            return None
+
+    try:
+        with sock:
+            sock.sendall(f"{input_path}\t{output_path}\t{model}\n".encode())
+            reply = b""
+            while not reply.endswith(b"\n"):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return False, "Daemon closed the connection"
+                reply += chunk
+    except OSError as e:
+        return False, str(e)
+
+    reply = reply.decode().rstrip("\n")
+    if reply == "ok":
+        return True, ""
+    if reply.startswith("error\t"):
+        return False, reply.split("\t", 1)[1]
+    return False, f"Unexpected daemon reply: {reply}"
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
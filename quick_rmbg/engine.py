@@ -0,0 +1,228 @@
+"""In-process rembg engine with a lazily loaded, shared model session."""
+
+import os
+import selectors
+import subprocess
+import sys
+from pathlib import Path
+
+from .config import get_quantize, get_rocm_gfx_version
+from .quantize import QUANTIZABLE_MODELS, quantized_model_path
+
+try:
+    from rembg import new_session, remove
+
+    HAS_REMBG_API = True
+except ImportError:
+    # rembg not importable in this environment; callers fall back to the CLI binary
+    HAS_REMBG_API = False
+
+# Shared session, created on first use and reused for every subsequent image/pass
+_session = None
+_session_model = None
+
+
+def get_session(model: str):
+    """
+    Get the shared rembg session for a model, loading it on first use.
+
+    The ONNX model weights are loaded exactly once per process; two-pass,
+    infinite-hop, and repeated calls all reuse the same session.
+
+    Args:
+        model: Model name to use (e.g. u2net)
+
+    Returns:
+        A rembg session object
+    """
+    global _session, _session_model
+
+    if _session is None or _session_model != model:
+        # ROCm override must be in the environment before ONNX Runtime initializes
+        rocm_gfx = get_rocm_gfx_version()
+        if rocm_gfx:
+            os.environ["HSA_OVERRIDE_GFX_VERSION"] = rocm_gfx
+
+        # Prefer the INT8 model if quantization is enabled and one exists;
+        # the u2net_custom session it loads through only suits u2net-family
+        # preprocessing, so other models always use their named session
+        quantized = quantized_model_path(model) if get_quantize() and model in QUANTIZABLE_MODELS else None
+        if quantized is not None and quantized.exists():
+            _session = new_session("u2net_custom", model_path=str(quantized))
+        else:
+            _session = new_session(model)
+        _session_model = model
+
+    return _session
+
+
+def run_rembg_bytes(data: bytes, model: str) -> bytes:
+    """
+    Remove the background from encoded image bytes using the shared session.
+
+    Args:
+        data: Encoded input image bytes
+        model: Model name to use
+
+    Returns:
+        Encoded PNG bytes with background removed
+    """
+    return remove(data, session=get_session(model))
+
+
+# Warm worker script served by the rembg binary's own interpreter
+_WORKER_SCRIPT = Path(__file__).parent / "_worker.py"
+
+# Worker singleton; disabled for the rest of the process if startup fails
+_worker = None
+_worker_disabled = False
+
+# Generous startup bound: the first run may need to download the model
+_WORKER_READY_TIMEOUT = 600.0
+
+
+def _rembg_interpreter(rembg_binary: Path) -> str:
+    """Get the Python interpreter the rembg binary runs under (its shebang)."""
+    try:
+        with open(rembg_binary, "rb") as f:
+            first_line = f.readline()
+        if first_line.startswith(b"#!"):
+            parts = first_line[2:].strip().decode().split()
+            if parts:
+                # "#!/usr/bin/env python3" -> "python3"
+                interpreter = parts[1] if parts[0].endswith("/env") and len(parts) > 1 else parts[0]
+                if "python" in interpreter:
+                    return interpreter
+    except (OSError, UnicodeDecodeError):
+        pass
+    return sys.executable
+
+
+class _Worker:
+    """
+    A prespawned rembg subprocess that has already loaded the model.
+
+    Dispatches one image per line over stdin/stdout, replacing the
+    per-image Python+torch import cost with a pipe write.
+    """
+
+    def __init__(self, rembg_binary: Path, model: str, env: dict):
+        self.model = model
+        self._ready = False
+        self._closed = False
+        self._proc = subprocess.Popen(
+            [_rembg_interpreter(rembg_binary), str(_WORKER_SCRIPT), model],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            text=True,
+        )
+
+    def alive(self) -> bool:
+        """Check whether the worker is still usable."""
+        return not self._closed and self._proc.poll() is None
+
+    def close(self) -> None:
+        """Shut the worker down."""
+        self._closed = True
+        if self._proc.stdin:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+        self._proc.terminate()
+
+    def _read_reply(self, timeout: float) -> str | None:
+        """Read one reply line, or None if the worker stays silent too long."""
+        sel = selectors.DefaultSelector()
+        sel.register(self._proc.stdout, selectors.EVENT_READ)
+        try:
+            if not sel.select(timeout):
+                return None
+        finally:
+            sel.close()
+        return self._proc.stdout.readline().strip()
+
+    def _await_ready(self) -> bool:
+        """Block until the worker has loaded the model (first use only)."""
+        global _worker_disabled
+
+        if self._ready:
+            return True
+        line = self._read_reply(_WORKER_READY_TIMEOUT)
+        if line == "ready":
+            self._ready = True
+            return True
+        # The worker's interpreter can't run rembg; don't retry per image
+        _worker_disabled = True
+        self.close()
+        return False
+
+    def submit(self, input_path: Path, output_path: Path, timeout: float = 120.0) -> tuple[bool, str]:
+        """
+        Process one image through the warm worker.
+
+        Args:
+            input_path: Path to input image
+            output_path: Path for output
+            timeout: Seconds to wait for this image before killing the worker
+
+        Returns:
+            Tuple of (success, error_message or empty string)
+        """
+        if not self._await_ready():
+            return False, "rembg worker failed to start"
+
+        try:
+            self._proc.stdin.write(f"{input_path}\t{output_path}\n")
+            self._proc.stdin.flush()
+            reply = self._read_reply(timeout)
+        except (BrokenPipeError, OSError) as e:
+            self.close()
+            return False, str(e)
+
+        if reply is None:
+            # Hung inference: kill this worker; the next image gets a fresh one
+            self.close()
+            return False, f"Operation timed out (>{timeout:.0f}s)"
+
+        if reply == "ok":
+            return True, ""
+        if reply.startswith("error\t"):
+            return False, reply.split("\t", 1)[1]
+        # Empty reply means the worker died mid-image
+        self.close()
+        return False, "rembg worker exited unexpectedly"
+
+
+def get_worker(rembg_binary: Path, model: str, env: dict):
+    """
+    Get the shared warm worker, spawning it on first use.
+
+    Returns None if workers are disabled (an earlier spawn failed) so the
+    caller can fall back to a one-shot rembg subprocess.
+    """
+    global _worker, _worker_disabled
+
+    if _worker_disabled:
+        return None
+
+    if _worker is None or not _worker.alive() or _worker.model != model:
+        try:
+            _worker = _Worker(rembg_binary, model, env)
+        except OSError:
+            _worker_disabled = True
+            return None
+
+    return _worker
+
+
+def prespawn_worker(rembg_binary: Path, model: str, env: dict) -> None:
+    """
+    Start the warm worker without waiting for it.
+
+    Spawning is cheap; the child imports rembg and loads the model in the
+    background while the CLI is still validating input.
+    """
+    get_worker(rembg_binary, model, env)
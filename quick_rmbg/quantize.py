@@ -0,0 +1,67 @@
+"""One-shot INT8 quantization of the cached rembg model."""
+
+import os
+from pathlib import Path
+
+from .config import get_model, set_quantize
+
+# Models sharing u2net's architecture and 320x320 preprocessing. The INT8
+# file is loaded through rembg's u2net_custom session, which hard-codes
+# that preprocessing, so quantizing e.g. isnet-general-use (1024x1024,
+# different normalization) would silently produce garbage masks.
+QUANTIZABLE_MODELS = frozenset({"u2net", "u2netp", "u2net_human_seg"})
+
+
+def model_cache_dir() -> Path:
+    """Directory where rembg caches downloaded model weights."""
+    return Path(os.environ.get("U2NET_HOME", str(Path.home() / ".u2net")))
+
+
+def quantized_model_path(model: str) -> Path:
+    """Path of the INT8 variant of a named model."""
+    return model_cache_dir() / f"{model}_int8.onnx"
+
+
+def quantize_model(model: str | None = None) -> tuple[bool, str]:
+    """
+    Quantize the cached model weights to INT8.
+
+    Dynamic quantization shrinks the weights about 4x and speeds up CPU
+    inference on VNNI-capable machines with negligible mask quality loss.
+    On success the config is updated so future runs pick up the quantized
+    file automatically.
+
+    Args:
+        model: Model name to quantize (default: the configured model)
+
+    Returns:
+        Tuple of (success, message)
+    """
+    if model is None:
+        model = get_model()
+
+    if model not in QUANTIZABLE_MODELS:
+        return False, (
+            f"Quantization only supports the u2net family "
+            f"({', '.join(sorted(QUANTIZABLE_MODELS))}), not: {model}"
+        )
+
+    src = model_cache_dir() / f"{model}.onnx"
+    if not src.exists():
+        return False, (
+            f"Cached model not found: {src}\n"
+            "Run a normal removal once so rembg downloads it first."
+        )
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        return False, "onnxruntime is required for quantization.\nInstall it with: pip install onnxruntime"
+
+    dst = quantized_model_path(model)
+    quantize_dynamic(str(src), str(dst), weight_type=QuantType.QInt8)
+    set_quantize(True)
+
+    src_mb = src.stat().st_size / 1e6
+    dst_mb = dst.stat().st_size / 1e6
+    return True, f"Quantized {model}: {src_mb:.0f} MB -> {dst_mb:.0f} MB\nSaved to: {dst}"